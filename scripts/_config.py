@@ -0,0 +1,28 @@
+"""
+Shared .claude/config.json loading for skill-generator plugin scripts.
+"""
+
+import functools
+import json
+
+DEFAULT_CONFIG_PATH = '.claude/config.json'
+
+
+@functools.lru_cache(maxsize=4)
+def load_claude_config(path: str = DEFAULT_CONFIG_PATH) -> dict:
+    """
+    Load a plugin config file once per process.
+
+    Args:
+        path: Path to the config JSON file
+
+    Returns:
+        Parsed config dict, or {} if the file is missing or invalid.
+        Callers must not mutate the returned dict; it is shared.
+    """
+    try:
+        with open(path, 'r') as f:
+            config = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return config if isinstance(config, dict) else {}
@@ -0,0 +1,45 @@
+"""
+Shared .env parsing for skill-generator plugin scripts.
+"""
+
+import functools
+
+
+def parse_env_file(filepath: str) -> dict:
+    """
+    Parse a .env file and return key-value pairs.
+
+    Args:
+        filepath: Path to the .env file
+
+    Returns:
+        Dictionary of environment variables (empty if the file is missing)
+    """
+    env_vars = {}
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read().decode('utf-8', 'replace')
+    except OSError:
+        return env_vars
+
+    for line in data.splitlines():
+        line = line.strip()
+        # Skip empty lines and comments
+        if not line or line[0] == '#':
+            continue
+        # Parse KEY=value format
+        eq = line.find('=')
+        if eq < 1:
+            continue
+        key = line[:eq].rstrip()
+        value = line[eq + 1:].lstrip()
+        # Remove matching quotes if present
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        env_vars[key] = value
+
+    return env_vars
+
+
+# Parsed once per process; callers must not mutate the returned dict
+load_env_file = functools.lru_cache(maxsize=4)(parse_env_file)
@@ -0,0 +1,31 @@
+"""
+JSON encode/decode helpers for skill-generator plugin scripts.
+
+Parsing uses orjson when installed and falls back to the stdlib json
+module. orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+callers can catch the stdlib exception either way.
+
+Serialization always uses the stdlib so printed output stays ASCII
+(non-ASCII escaped), whatever the stdout encoding and whether or not
+orjson is installed.
+"""
+
+import json
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, indent: Optional[int] = 2) -> str:
+    """Serialize obj to an ASCII JSON string (pretty-printed unless indent is None)."""
+    return json.dumps(obj, indent=indent)
+
+
+def loads(data):
+    """Parse JSON from str or bytes."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,117 @@
+"""
+Shared keep-alive HTTPS client for skill-generator plugin scripts.
+"""
+
+import base64
+import gzip
+import http.client
+import threading
+import urllib.request
+from typing import Optional
+from urllib.parse import unquote, urljoin, urlsplit
+
+# Redirects followed for GET requests, as urllib's opener did
+_REDIRECT_STATUSES = frozenset((301, 302, 307, 308))
+_MAX_REDIRECTS = 5
+
+
+class KeepAliveClient:
+    """
+    Persistent HTTPS connections to a single host.
+
+    Each thread keeps its own HTTP/1.1 connection, so repeated requests
+    reuse one TLS session while concurrent callers don't serialize on a
+    shared socket. Responses are requested gzip-encoded and decompressed
+    transparently. HTTPS_PROXY/NO_PROXY are honored by tunnelling through
+    the proxy, and same-host GET redirects are followed.
+    """
+
+    def __init__(self, host: str, timeout: float):
+        self.host = host
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _new_connection(self) -> http.client.HTTPSConnection:
+        """Open a connection to the host, through the HTTPS proxy if one is configured."""
+        proxy = urllib.request.getproxies().get("https")
+        if not proxy or urllib.request.proxy_bypass(self.host):
+            return http.client.HTTPSConnection(self.host, timeout=self.timeout)
+
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        parts = urlsplit(proxy)
+        tunnel_headers = {}
+        if parts.username:
+            credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+        conn = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=self.timeout)
+        conn.set_tunnel(self.host, headers=tunnel_headers)
+        return conn
+
+    def _connection(self) -> tuple[http.client.HTTPSConnection, bool]:
+        """Return this thread's connection and whether it was just created."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn, False
+        conn = self._new_connection()
+        self._local.conn = conn
+        return conn, True
+
+    def _discard(self, conn: http.client.HTTPSConnection) -> None:
+        conn.close()
+        self._local.conn = None
+
+    def _send(self, method: str, path: str, headers: dict,
+              body: bytes) -> tuple[http.client.HTTPResponse, bytes]:
+        """Send one request, retrying once if a reused connection was closed."""
+        while True:
+            conn, fresh = self._connection()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                return response, response.read()
+            except (http.client.BadStatusLine, ConnectionError):
+                self._discard(conn)
+                if fresh:
+                    raise
+            except Exception:
+                self._discard(conn)
+                raise
+
+    def _redirect_path(self, path: str, location: str) -> Optional[str]:
+        """Return the path to follow for a same-host redirect, or None."""
+        target = urlsplit(urljoin(f"https://{self.host}{path}", location))
+        if target.scheme != "https" or target.netloc != self.host:
+            return None
+        return f"{target.path}?{target.query}" if target.query else target.path
+
+    def request(self, method: str, path: str, headers: dict = None,
+                body: bytes = None) -> tuple[http.client.HTTPResponse, bytes]:
+        """
+        Send a request and read the full response body.
+
+        A reused connection that the server has since closed is reopened
+        and the request retried once. GET redirects to the same host are
+        followed up to _MAX_REDIRECTS hops; any other redirect response is
+        returned to the caller as is.
+
+        Returns:
+            Tuple of (response, decompressed body bytes)
+
+        Raises:
+            OSError or http.client.HTTPException on network failure
+        """
+        headers = {"Accept-Encoding": "gzip", **(headers or {})}
+        response, data = self._send(method, path, headers, body)
+        for _ in range(_MAX_REDIRECTS):
+            if method != "GET" or response.status not in _REDIRECT_STATUSES:
+                break
+            location = response.headers.get("Location")
+            path = location and self._redirect_path(path, location)
+            if not path:
+                break
+            response, data = self._send(method, path, headers, body)
+
+        if response.headers.get("Content-Encoding", "").lower() == "gzip":
+            data = gzip.decompress(data)
+        return response, data
@@ -7,65 +7,53 @@ Falls back gracefully if API key is not available.
 
 Usage:
     python firecrawl_utils.py scrape <url> [--api-key <key>] [--config <path>] [--max-chars <int>] [--output <path>]
+                                           [--ttl <seconds>] [--no-cache] [--no-stdout-content]
     python firecrawl_utils.py scrape <url> --config .claude/config.json
 
+Successful scrapes are cached under .claude/tmp/firecrawl/ for an hour
+(override with --ttl or FIRECRAWL_CACHE_TTL; disable with --no-cache).
+--no-stdout-content leaves the markdown out of the JSON output; combine it
+with --output and read the file at content_path instead.
+
 Examples:
     python firecrawl_utils.py scrape https://codewiki.google/github.com/juliangarnier/anime
     python firecrawl_utils.py scrape https://example.com --api-key fc-xxx
     python firecrawl_utils.py scrape https://codewiki.google/github.com/juliangarnier/anime --max-chars 200000 --output .claude/tmp/firecrawl/anime.md
 """
 
+import functools
+import hashlib
+import http.client
 import json
 import os
 import sys
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
-
-
-FIRECRAWL_API_URL = "https://api.firecrawl.dev/v1/scrape"
-
+import time
+from urllib.parse import urlsplit
 
-def parse_env_file(filepath: str) -> dict:
-    """
-    Parse a .env file and return key-value pairs.
+from _config import DEFAULT_CONFIG_PATH, load_claude_config
+from _env import load_env_file, parse_env_file
+from _fastjson import dumps as json_dumps, loads as json_loads
+from _http import KeepAliveClient
 
-    Args:
-        filepath: Path to the .env file
 
-    Returns:
-        Dictionary of environment variables
-    """
-    env_vars = {}
-    if not os.path.exists(filepath):
-        return env_vars
+FIRECRAWL_API_URL = "https://api.firecrawl.dev/v1/scrape"
 
-    try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                # Parse KEY=value format
-                if '=' in line:
-                    key, _, value = line.partition('=')
-                    key = key.strip()
-                    value = value.strip()
-                    # Remove quotes if present
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    env_vars[key] = value
-    except IOError:
-        pass
+# Persistent connection to the Firecrawl API, reused across calls
+_FIRECRAWL_API = KeepAliveClient(urlsplit(FIRECRAWL_API_URL).netloc, timeout=60)
 
-    return env_vars
+# Scrape cache location and default time-to-live in seconds
+FIRECRAWL_CACHE_DIR = os.path.join(".claude", "tmp", "firecrawl")
+DEFAULT_CACHE_TTL = 3600
 
 
+@functools.lru_cache(maxsize=4)
 def get_api_key(config_path: str = None) -> str:
     """
     Get Firecrawl API key from multiple sources.
 
+    The key is resolved once per config_path per process; see
+    _reset_api_key_cache().
+
     Priority:
     1. Provided config file (.claude/config.json)
     2. .env file in working directory
@@ -74,36 +62,19 @@ def get_api_key(config_path: str = None) -> str:
     Returns:
         API key string or None if not found
     """
-    # Check config file first
-    if config_path and os.path.exists(config_path):
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                key = config.get('firecrawl_api_key', '')
-                if key and key.strip():
-                    return key.strip()
-        except (json.JSONDecodeError, IOError):
-            pass
-
-    # Check default config location
-    default_config = '.claude/config.json'
-    if os.path.exists(default_config):
-        try:
-            with open(default_config, 'r') as f:
-                config = json.load(f)
-                key = config.get('firecrawl_api_key', '')
-                if key and key.strip():
-                    return key.strip()
-        except (json.JSONDecodeError, IOError):
-            pass
-
-    # Check .env file in working directory
-    env_vars = parse_env_file('.env')
-    if 'FIRECRAWL_API_KEY' in env_vars:
-        key = env_vars['FIRECRAWL_API_KEY']
+    # Check config file first, then the default config location
+    for path in (config_path, DEFAULT_CONFIG_PATH):
+        if not path:
+            continue
+        key = load_claude_config(path).get('firecrawl_api_key', '')
         if key and key.strip():
             return key.strip()
 
+    # Check .env file in working directory
+    key = load_env_file('.env').get('FIRECRAWL_API_KEY', '')
+    if key and key.strip():
+        return key.strip()
+
     # Check environment variable
     env_key = os.environ.get('FIRECRAWL_API_KEY', '')
     if env_key and env_key.strip():
@@ -112,7 +83,48 @@ def get_api_key(config_path: str = None) -> str:
     return None
 
 
-def scrape_url(url: str, api_key: str, formats: list = None) -> dict:
+def _reset_api_key_cache() -> None:
+    """Forget cached API keys so the next lookup re-reads their sources."""
+    get_api_key.cache_clear()
+    load_claude_config.cache_clear()
+    load_env_file.cache_clear()
+
+
+def _scrape_cache_path(url: str) -> str:
+    """Path of the cached scrape for a URL."""
+    key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(FIRECRAWL_CACHE_DIR, key + ".json")
+
+
+def _load_cached_scrape(url: str, ttl: float) -> dict:
+    """Return a cached scrape younger than ttl seconds, or None."""
+    path = _scrape_cache_path(url)
+    try:
+        if time.time() - os.stat(path).st_mtime >= ttl:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(cached, dict) or cached.get('url') != url:
+        return None
+    return cached
+
+
+def _store_cached_scrape(url: str, content: str, metadata: dict) -> None:
+    """Atomically write a successful scrape to the cache."""
+    path = _scrape_cache_path(url)
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(FIRECRAWL_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"url": url, "content": content, "metadata": metadata}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def scrape_url(url: str, api_key: str, formats: list = None, cache_ttl: float = None) -> dict:
     """
     Scrape a URL using the Firecrawl API.
 
@@ -120,10 +132,22 @@ def scrape_url(url: str, api_key: str, formats: list = None) -> dict:
         url: The URL to scrape
         api_key: Firecrawl API key
         formats: List of output formats (default: ["markdown"])
+        cache_ttl: Serve and store scrapes in FIRECRAWL_CACHE_DIR, reusing
+            entries younger than this many seconds (default: no caching)
 
     Returns:
         dict with 'success', 'content', and 'error' keys
     """
+    if cache_ttl is not None:
+        cached = _load_cached_scrape(url, cache_ttl)
+        if cached:
+            return {
+                "success": True,
+                "content": cached.get('content', ''),
+                "metadata": cached.get('metadata', {}),
+                "error": None
+            }
+
     if not api_key:
         return {
             "success": False,
@@ -147,60 +171,70 @@ def scrape_url(url: str, api_key: str, formats: list = None) -> dict:
 
     try:
         data = json.dumps(payload).encode('utf-8')
-        req = Request(FIRECRAWL_API_URL, data=data, headers=headers, method='POST')
-
-        with urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode('utf-8'))
-
-            if result.get('success'):
-                content = result.get('data', {}).get('markdown', '')
-                return {
-                    "success": True,
-                    "content": content,
-                    "metadata": result.get('data', {}).get('metadata', {}),
-                    "error": None
-                }
-            else:
-                return {
-                    "success": False,
-                    "content": None,
-                    "error": result.get('error', 'Unknown error from Firecrawl API')
-                }
+        response, body = _FIRECRAWL_API.request(
+            'POST', urlsplit(FIRECRAWL_API_URL).path, headers=headers, body=data
+        )
+    except (OSError, http.client.HTTPException) as e:
+        return {
+            "success": False,
+            "content": None,
+            "error": f"Network error: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "content": None,
+            "error": f"Unexpected error: {str(e)}"
+        }
 
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8') if e.fp else ''
-        if e.code == 401:
-            return {
-                "success": False,
-                "content": None,
-                "error": f"Unauthorized: Invalid API key. Get one at https://firecrawl.dev"
-            }
-        elif e.code == 402:
-            return {
-                "success": False,
-                "content": None,
-                "error": "Payment required: Firecrawl API quota exceeded"
-            }
-        elif e.code == 429:
+    if response.status == 401:
+        return {
+            "success": False,
+            "content": None,
+            "error": f"Unauthorized: Invalid API key. Get one at https://firecrawl.dev"
+        }
+    elif response.status == 402:
+        return {
+            "success": False,
+            "content": None,
+            "error": "Payment required: Firecrawl API quota exceeded"
+        }
+    elif response.status == 429:
+        return {
+            "success": False,
+            "content": None,
+            "error": "Rate limited: Too many requests to Firecrawl API"
+        }
+    elif response.status >= 300:
+        error_body = body.decode('utf-8', 'replace')
+        return {
+            "success": False,
+            "content": None,
+            "error": f"HTTP {response.status}: {error_body or response.reason}"
+        }
+
+    try:
+        # Parse the raw bytes directly; the markdown payload can be large
+        result = json_loads(body)
+
+        if result.get('success'):
+            content = result.get('data', {}).get('markdown', '')
+            metadata = result.get('data', {}).get('metadata', {})
+            if cache_ttl is not None:
+                _store_cached_scrape(url, content, metadata)
             return {
-                "success": False,
-                "content": None,
-                "error": "Rate limited: Too many requests to Firecrawl API"
+                "success": True,
+                "content": content,
+                "metadata": metadata,
+                "error": None
             }
         else:
             return {
                 "success": False,
                 "content": None,
-                "error": f"HTTP {e.code}: {error_body or str(e)}"
+                "error": result.get('error', 'Unknown error from Firecrawl API')
             }
 
-    except URLError as e:
-        return {
-            "success": False,
-            "content": None,
-            "error": f"Network error: {str(e)}"
-        }
-
     except Exception as e:
         return {
             "success": False,
@@ -228,6 +262,9 @@ def main():
     config_path = None
     max_chars = None
     output_path = None
+    use_cache = True
+    cache_ttl = None
+    stdout_content = True
 
     i = 3
     while i < len(sys.argv):
@@ -250,6 +287,19 @@ def main():
         elif sys.argv[i] == "--output" and i + 1 < len(sys.argv):
             output_path = sys.argv[i + 1]
             i += 2
+        elif sys.argv[i] == "--ttl" and i + 1 < len(sys.argv):
+            try:
+                cache_ttl = float(sys.argv[i + 1])
+            except ValueError:
+                print("Invalid value for --ttl. Must be a number of seconds.")
+                sys.exit(1)
+            i += 2
+        elif sys.argv[i] == "--no-cache":
+            use_cache = False
+            i += 1
+        elif sys.argv[i] == "--no-stdout-content":
+            stdout_content = False
+            i += 1
         else:
             i += 1
 
@@ -257,8 +307,16 @@ def main():
     if not api_key:
         api_key = get_api_key(config_path)
 
+    if not use_cache:
+        cache_ttl = None
+    elif cache_ttl is None:
+        try:
+            cache_ttl = float(os.environ.get('FIRECRAWL_CACHE_TTL', DEFAULT_CACHE_TTL))
+        except ValueError:
+            cache_ttl = DEFAULT_CACHE_TTL
+
     # Scrape the URL
-    result = scrape_url(url, api_key)
+    result = scrape_url(url, api_key, cache_ttl=cache_ttl)
 
     if result.get("success"):
         content = result.get("content") or ""
@@ -279,7 +337,13 @@ def main():
                     "error": f"Failed to write output file: {e}"
                 }
 
-        if result.get("success") and max_chars is not None:
+        if result.get("success") and not stdout_content:
+            # Skip copying content into the output at all
+            del result["content"]
+            result["content_length"] = content_length
+            if max_chars is not None:
+                result["content_truncated"] = content_length > max_chars
+        elif result.get("success") and max_chars is not None:
             if content_length > max_chars:
                 result["content"] = content[:max_chars]
                 result["content_truncated"] = True
@@ -288,7 +352,7 @@ def main():
             result["content_length"] = content_length
 
     # Output as JSON
-    print(json.dumps(result, indent=2))
+    print(json_dumps(result))
 
     sys.exit(0 if result["success"] else 1)
 
@@ -12,46 +12,62 @@ Usage:
     python github_utils.py verify <github_url>
     python github_utils.py codewiki <github_url>
     python github_utils.py full <github_url>
+    python github_utils.py full-batch < urls.txt
 """
 
+import functools
+import http.client
 import json
 import os
-import re
+import string
 import sys
-import urllib.request
-import urllib.error
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass, asdict
 
+from _config import load_claude_config
+from _env import load_env_file, parse_env_file
+from _fastjson import dumps as json_dumps, loads as json_loads
+from _http import KeepAliveClient
 
-def parse_env_file(filepath: str) -> dict:
-    """Parse a .env file and return key-value pairs."""
-    env_vars = {}
-    if not os.path.exists(filepath):
-        return env_vars
-    try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if '=' in line:
-                    key, _, value = line.partition('=')
-                    key = key.strip()
-                    value = value.strip()
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    env_vars[key] = value
-    except IOError:
-        pass
-    return env_vars
+
+# Repository root URL: https://github.com/{owner}/{repo}[.git][/]
+_GITHUB_URL_PREFIX = "https://github.com/"
+# Deletes every allowed name character, so anything left over is invalid
+_GITHUB_NAME_STRIP = str.maketrans("", "", string.ascii_letters + string.digits + "._-")
+_GITHUB_NAME_BAD_PREFIX = frozenset("-.")
+# Characters that can never appear in a repository root URL path
+_GITHUB_URL_FORBIDDEN = frozenset(" \t\n\r?#@%<>\"'\\")
+
+# Persistent connection to the GitHub API, reused across calls
+_GITHUB_API = KeepAliveClient("api.github.com", timeout=30)
+_GITHUB_API_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "skill-generator-plugin/1.0",
+}
+
+# Repository metadata cached with its ETag for conditional requests
+GITHUB_CACHE_DIR = os.path.join(".claude", "tmp", "github_cache")
+
+# Repository API fields read by _metadata_from_api; the rest is discarded
+_REPO_FIELDS = (
+    "full_name", "description", "default_branch", "topics", "license",
+    "homepage", "stargazers_count", "fork", "archived", "language",
+    "created_at", "updated_at",
+)
+
+# Epoch seconds until which the API reported an exhausted rate limit
+_rate_limit_reset = 0.0
 
 
+@functools.lru_cache(maxsize=1)
 def get_github_token() -> Optional[str]:
     """
     Get GitHub token from multiple sources.
 
+    The token is resolved once per process; see _reset_token_cache().
+
     Priority:
     1. .claude/config.json
     2. .env file in working directory
@@ -61,23 +77,14 @@ def get_github_token() -> Optional[str]:
         Token string or None if not found
     """
     # Check .claude/config.json
-    config_path = '.claude/config.json'
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                token = config.get('github_token', '')
-                if token and token.strip():
-                    return token.strip()
-        except (json.JSONDecodeError, IOError):
-            pass
+    token = load_claude_config().get('github_token', '')
+    if token and token.strip():
+        return token.strip()
 
     # Check .env file
-    env_vars = parse_env_file('.env')
-    if 'GITHUB_TOKEN' in env_vars:
-        token = env_vars['GITHUB_TOKEN']
-        if token and token.strip():
-            return token.strip()
+    token = load_env_file('.env').get('GITHUB_TOKEN', '')
+    if token and token.strip():
+        return token.strip()
 
     # Check environment variable
     env_token = os.environ.get('GITHUB_TOKEN', '')
@@ -87,7 +94,14 @@ def get_github_token() -> Optional[str]:
     return None
 
 
-@dataclass
+def _reset_token_cache() -> None:
+    """Forget the cached GitHub token so the next lookup re-reads its sources."""
+    get_github_token.cache_clear()
+    load_claude_config.cache_clear()
+    load_env_file.cache_clear()
+
+
+@dataclass(slots=True, frozen=True)
 class ParsedGitHubURL:
     """Parsed components of a GitHub repository URL."""
     owner: str
@@ -96,7 +110,7 @@ class ParsedGitHubURL:
     normalized_url: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RepoMetadata:
     """Metadata from GitHub API response."""
     full_name: str
@@ -113,7 +127,7 @@ class RepoMetadata:
     updated_at: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerificationResult:
     """Result of GitHub repository verification."""
     success: bool
@@ -123,6 +137,13 @@ class VerificationResult:
     error: Optional[str]
 
 
+def _malformed_url_error(url: str) -> str:
+    """Describe why a github.com URL is not a usable repository root URL."""
+    if url.count("/") < 4:
+        return "URL appears to be missing the repository name. Format: https://github.com/juliangarnier/anime"
+    return f"Invalid GitHub repository URL format: {url}"
+
+
 def parse_github_url(url: str) -> tuple[Optional[ParsedGitHubURL], Optional[str]]:
     """
     Parse and validate a GitHub repository URL.
@@ -146,38 +167,40 @@ def parse_github_url(url: str) -> tuple[Optional[ParsedGitHubURL], Optional[str]
     # Normalize URL
     url = url.strip()
 
+    # Cheap rejection of empty and non-GitHub input before any parsing
+    if not url or "github.com" not in url.lower():
+        return None, "Not a GitHub URL. Expected format: https://github.com/juliangarnier/anime"
+
     # Add https:// if missing
     if url.startswith("github.com"):
         url = "https://" + url
     elif url.startswith("http://github.com"):
-        url = url.replace("http://", "https://")
-
-    # Validate it's a GitHub URL
-    github_pattern = r'^https://github\.com/([a-zA-Z0-9._-]+)/([a-zA-Z0-9._-]+)(?:\.git)?/?$'
-    match = re.match(github_pattern, url)
-
-    if not match:
-        # Check if it's a GitHub URL but malformed
-        if "github.com" in url.lower():
-            # Check for common issues
-            if "/tree/" in url or "/blob/" in url:
-                return None, "URL points to a specific file/branch. Use the repository root URL (e.g., https://github.com/juliangarnier/anime)"
-            if url.count("/") < 4:
-                return None, "URL appears to be missing the repository name. Format: https://github.com/juliangarnier/anime"
-            return None, f"Invalid GitHub repository URL format: {url}"
-        return None, f"Not a GitHub URL. Expected format: https://github.com/juliangarnier/anime"
-
-    owner = match.group(1)
-    repo = match.group(2)
-
-    # Remove .git suffix if present
-    if repo.endswith(".git"):
-        repo = repo[:-4]
+        url = "https://" + url.removeprefix("http://")
+
+    if not url.startswith(_GITHUB_URL_PREFIX):
+        return None, _malformed_url_error(url)
+
+    rest = url[len(_GITHUB_URL_PREFIX):]
+    if "/tree/" in rest or "/blob/" in rest:
+        return None, "URL points to a specific file/branch. Use the repository root URL (e.g., https://github.com/juliangarnier/anime)"
+    if not _GITHUB_URL_FORBIDDEN.isdisjoint(rest):
+        return None, f"URL contains invalid characters: {url}"
+
+    # Split into owner/repo, dropping trailing slash and .git suffix
+    rest = rest.rstrip("/").removesuffix(".git")
+    slash = rest.find("/")
+    if slash < 1:
+        return None, _malformed_url_error(url)
+    owner, repo = rest[:slash], rest[slash + 1:]
+    if not repo or "/" in repo:
+        return None, _malformed_url_error(url)
+    if owner.translate(_GITHUB_NAME_STRIP) or repo.translate(_GITHUB_NAME_STRIP):
+        return None, _malformed_url_error(url)
 
     # Validate owner and repo names
-    if owner.startswith("-") or owner.startswith("."):
+    if owner[:1] in _GITHUB_NAME_BAD_PREFIX:
         return None, f"Invalid owner name: {owner}"
-    if repo.startswith("-") or repo.startswith("."):
+    if repo[:1] in _GITHUB_NAME_BAD_PREFIX:
         return None, f"Invalid repository name: {repo}"
 
     normalized_url = f"https://github.com/{owner}/{repo}"
@@ -190,10 +213,78 @@ def parse_github_url(url: str) -> tuple[Optional[ParsedGitHubURL], Optional[str]
     ), None
 
 
+def _cache_path(owner: str, repo: str) -> str:
+    """Path of the cached API response for a repository."""
+    return os.path.join(GITHUB_CACHE_DIR, f"{owner}_{repo}.json")
+
+
+def _load_cached_repo(owner: str, repo: str) -> Optional[dict]:
+    """Load a cached {"etag", "data"} entry, or None if absent or unreadable."""
+    try:
+        with open(_cache_path(owner, repo), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(cached, dict) or not isinstance(cached.get("data"), dict):
+        return None
+    return cached
+
+
+def _store_cached_repo(owner: str, repo: str, etag: str, data: dict) -> None:
+    """Atomically write an API response and its ETag to the cache."""
+    path = _cache_path(owner, repo)
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(GITHUB_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"etag": etag, "data": data}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _note_rate_limit(headers) -> None:
+    """Remember when an exhausted rate limit resets, from response headers."""
+    global _rate_limit_reset
+    if headers is None or headers.get("X-RateLimit-Remaining") != "0":
+        return
+    try:
+        _rate_limit_reset = float(headers.get("X-RateLimit-Reset", "0"))
+    except ValueError:
+        pass
+
+
+def _metadata_from_api(data: dict, owner: str, repo: str) -> RepoMetadata:
+    """Build RepoMetadata from a GitHub API repository response."""
+    # Extract license info safely
+    license_name = None
+    if data.get("license") and isinstance(data["license"], dict):
+        license_name = data["license"].get("spdx_id") or data["license"].get("name")
+
+    return RepoMetadata(
+        full_name=data.get("full_name", f"{owner}/{repo}"),
+        description=data.get("description"),
+        default_branch=data.get("default_branch", "main"),
+        topics=data.get("topics", []),
+        license=license_name,
+        homepage=data.get("homepage"),
+        stargazers_count=data.get("stargazers_count", 0),
+        fork=data.get("fork", False),
+        archived=data.get("archived", False),
+        language=data.get("language"),
+        created_at=data.get("created_at", ""),
+        updated_at=data.get("updated_at", "")
+    )
+
+
 def verify_repository(owner: str, repo: str) -> tuple[Optional[RepoMetadata], Optional[str]]:
     """
     Verify repository exists and retrieve metadata via GitHub API.
 
+    Responses are cached with their ETag under GITHUB_CACHE_DIR. Later calls
+    send If-None-Match and reuse the cached data on 304 Not Modified, or
+    without a request at all while the rate limit is known to be exhausted.
+
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
@@ -201,66 +292,71 @@ def verify_repository(owner: str, repo: str) -> tuple[Optional[RepoMetadata], Op
     Returns:
         Tuple of (RepoMetadata or None, error message or None)
     """
-    api_url = f"https://api.github.com/repos/{owner}/{repo}"
+    cached = _load_cached_repo(owner, repo)
+    if time.time() < _rate_limit_reset:
+        if cached:
+            return _metadata_from_api(cached["data"], owner, repo), None
+        return None, f"GitHub API rate limit exceeded. Resets at timestamp: {int(_rate_limit_reset)}. Consider using a GitHub token."
 
-    # Build headers with optional authentication
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "skill-generator-plugin/1.0"
-    }
+    headers = dict(_GITHUB_API_HEADERS)
 
     # Add auth token if available (increases rate limit from 60 to 5000 req/hour)
     token = get_github_token()
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
+    # Conditional request; 304 responses don't count against the rate limit
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    try:
+        response, body = _GITHUB_API.request("GET", f"/repos/{owner}/{repo}", headers=headers)
+    except (OSError, http.client.HTTPException) as e:
+        return None, f"Network error connecting to GitHub API: {e}"
+    except Exception as e:
+        return None, f"Unexpected error: {type(e).__name__}: {e}"
+
+    _note_rate_limit(response.headers)
+    status = response.status
+
+    if status == 304 and cached:
+        return _metadata_from_api(cached["data"], owner, repo), None
+    if status == 404:
+        return None, f"Repository not found: {owner}/{repo}. Verify the URL is correct and the repository is public."
+    elif status == 403:
+        # Check if rate limited
+        remaining = response.headers.get("X-RateLimit-Remaining", "unknown")
+        if remaining == "0":
+            if cached:
+                return _metadata_from_api(cached["data"], owner, repo), None
+            reset_time = response.headers.get("X-RateLimit-Reset", "unknown")
+            return None, f"GitHub API rate limit exceeded. Resets at timestamp: {reset_time}. Consider using a GitHub token."
+        return None, f"Access forbidden for {owner}/{repo}. The repository may be private."
+    elif status == 401:
+        return None, "GitHub API authentication error. Check your credentials."
+    elif status >= 300:
+        return None, f"GitHub API error (HTTP {status}): {response.reason}"
+    elif status != 200:
+        return None, f"Unexpected status code: {status}"
+
     try:
-        req = urllib.request.Request(api_url, headers=headers)
-
-        with urllib.request.urlopen(req, timeout=30) as response:
-            if response.status != 200:
-                return None, f"Unexpected status code: {response.status}"
-
-            data = json.loads(response.read().decode("utf-8"))
-
-            # Extract license info safely
-            license_name = None
-            if data.get("license") and isinstance(data["license"], dict):
-                license_name = data["license"].get("spdx_id") or data["license"].get("name")
-
-            return RepoMetadata(
-                full_name=data.get("full_name", f"{owner}/{repo}"),
-                description=data.get("description"),
-                default_branch=data.get("default_branch", "main"),
-                topics=data.get("topics", []),
-                license=license_name,
-                homepage=data.get("homepage"),
-                stargazers_count=data.get("stargazers_count", 0),
-                fork=data.get("fork", False),
-                archived=data.get("archived", False),
-                language=data.get("language"),
-                created_at=data.get("created_at", ""),
-                updated_at=data.get("updated_at", "")
-            ), None
-
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return None, f"Repository not found: {owner}/{repo}. Verify the URL is correct and the repository is public."
-        elif e.code == 403:
-            # Check if rate limited
-            remaining = e.headers.get("X-RateLimit-Remaining", "unknown")
-            if remaining == "0":
-                reset_time = e.headers.get("X-RateLimit-Reset", "unknown")
-                return None, f"GitHub API rate limit exceeded. Resets at timestamp: {reset_time}. Consider using a GitHub token."
-            return None, f"Access forbidden for {owner}/{repo}. The repository may be private."
-        elif e.code == 401:
-            return None, "GitHub API authentication error. Check your credentials."
-        else:
-            return None, f"GitHub API error (HTTP {e.code}): {e.reason}"
-    except urllib.error.URLError as e:
-        return None, f"Network error connecting to GitHub API: {e.reason}"
-    except json.JSONDecodeError as e:
+        data = json_loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
         return None, f"Failed to parse GitHub API response: {e}"
+
+    # Keep only the fields we use, so cache files stay small and cheap to load
+    if isinstance(data, dict):
+        data = {k: data[k] for k in _REPO_FIELDS if k in data}
+        license_info = data.get("license")
+        if isinstance(license_info, dict):
+            data["license"] = {k: license_info.get(k) for k in ("spdx_id", "name")}
+
+        etag = response.headers.get("ETag")
+        if etag:
+            _store_cached_repo(owner, repo, etag, data)
+
+    try:
+        return _metadata_from_api(data, owner, repo), None
     except Exception as e:
         return None, f"Unexpected error: {type(e).__name__}: {e}"
 
@@ -323,20 +419,49 @@ def full_verification(url: str) -> VerificationResult:
     )
 
 
-def result_to_json(result: VerificationResult) -> str:
-    """Convert VerificationResult to JSON string."""
-    def serialize(obj):
-        if hasattr(obj, "__dict__"):
-            return {k: serialize(v) for k, v in obj.__dict__.items() if v is not None}
+def full_verification_many(urls: list[str], max_workers: int = 8) -> list[VerificationResult]:
+    """
+    Run the full verification pipeline on several GitHub URLs concurrently.
+
+    Once any request reports an exhausted rate limit, the remaining URLs
+    are answered from the cache (or fail fast) until the limit resets.
+
+    Args:
+        urls: GitHub repository URLs
+        max_workers: Maximum number of concurrent API requests
+
+    Returns:
+        List of VerificationResult in the same order as urls
+    """
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+        return list(executor.map(full_verification, urls))
+
+
+def result_to_json(result: VerificationResult, indent: Optional[int] = 2) -> str:
+    """Convert VerificationResult to JSON string, omitting None fields."""
+    def prune(obj):
+        if isinstance(obj, dict):
+            return {k: prune(v) for k, v in obj.items() if v is not None}
         elif isinstance(obj, list):
-            return [serialize(item) for item in obj]
+            return [prune(item) for item in obj]
         return obj
 
-    return json.dumps(serialize(result), indent=2)
+    return json_dumps(prune(asdict(result)), indent=indent)
 
 
 def main():
     """CLI entry point."""
+    command = sys.argv[1].lower() if len(sys.argv) > 1 else ""
+
+    if command == "full-batch":
+        urls = [line.strip() for line in sys.stdin if line.strip()]
+        results = full_verification_many(urls)
+        for result in results:
+            print(result_to_json(result, indent=None))
+        sys.exit(0 if all(r.success for r in results) else 1)
+
     if len(sys.argv) < 3:
         print(__doc__)
         print("\nCommands:")
@@ -344,9 +469,9 @@ def main():
         print("  verify <url>    Verify repository exists via GitHub API")
         print("  codewiki <url>  Generate Codewiki URL from GitHub URL")
         print("  full <url>      Run full verification pipeline (parse + verify + codewiki)")
+        print("  full-batch      Run full verification on newline-separated URLs from stdin (NDJSON output)")
         sys.exit(1)
 
-    command = sys.argv[1].lower()
     url = sys.argv[2]
 
     if command == "parse":
@@ -354,13 +479,13 @@ def main():
         if error:
             print(json.dumps({"success": False, "error": error}))
             sys.exit(1)
-        print(json.dumps({
+        print(json_dumps({
             "success": True,
             "owner": parsed.owner,
             "repo": parsed.repo,
             "original_url": parsed.original_url,
             "normalized_url": parsed.normalized_url
-        }, indent=2))
+        }))
 
     elif command == "verify":
         parsed, error = parse_github_url(url)
@@ -373,12 +498,12 @@ def main():
             print(json.dumps({"success": False, "error": error}))
             sys.exit(1)
 
-        print(json.dumps({
+        print(json_dumps({
             "success": True,
             "owner": parsed.owner,
             "repo": parsed.repo,
             **asdict(metadata)
-        }, indent=2))
+        }))
 
     elif command == "codewiki":
         parsed, error = parse_github_url(url)
@@ -387,11 +512,11 @@ def main():
             sys.exit(1)
 
         codewiki_url = github_to_codewiki_url(parsed.owner, parsed.repo)
-        print(json.dumps({
+        print(json_dumps({
             "success": True,
             "github_url": parsed.normalized_url,
             "codewiki_url": codewiki_url
-        }, indent=2))
+        }))
 
     elif command == "full":
         result = full_verification(url)
@@ -400,7 +525,7 @@ def main():
 
     else:
         print(f"Unknown command: {command}")
-        print("Use: parse, verify, codewiki, or full")
+        print("Use: parse, verify, codewiki, full, or full-batch")
         sys.exit(1)
 
 
@@ -5,13 +5,15 @@ Skill Packager - Creates a distributable .skill file from a skill folder.
 A .skill file is a zip archive that can be shared and imported into Claude.
 
 Usage:
-    python package_skill.py <path/to/skill-folder> [output-directory]
+    python package_skill.py <path/to/skill-folder> [output-directory] [--compression deflate|bzip2|lzma]
 
 Examples:
     python package_skill.py ./anime-js
     python package_skill.py ./anime-js ./dist
+    python package_skill.py ./anime-js ./dist --compression lzma
 """
 
+import os
 import sys
 import zipfile
 from pathlib import Path
@@ -29,13 +31,30 @@ except ImportError:
         return type('Result', (), {'valid': True, 'issues': []})()
 
 
-def package_skill(skill_path, output_dir=None):
+# Already-compressed formats are stored as-is; deflating them again wastes CPU
+_INCOMPRESSIBLE = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.woff', '.woff2',
+    '.mp4', '.mp3', '.zip', '.gz', '.xz', '.zst', '.br'
+})
+
+# Directories never included in a package (hidden directories are skipped too)
+_SKIPPED_DIRS = frozenset({'__pycache__', 'node_modules'})
+
+COMPRESSION_METHODS = {
+    'deflate': zipfile.ZIP_DEFLATED,
+    'bzip2': zipfile.ZIP_BZIP2,
+    'lzma': zipfile.ZIP_LZMA,
+}
+
+
+def package_skill(skill_path, output_dir=None, compression=zipfile.ZIP_DEFLATED):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        compression: zipfile compression method for compressible files
 
     Returns:
         Path to the created .skill file, or None if error
@@ -82,24 +101,29 @@ def package_skill(skill_path, output_dir=None):
 
     # Create the .skill file (zip format)
     try:
-        with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            file_count = 0
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
+        with zipfile.ZipFile(skill_filename, 'w') as zipf:
+            # Walk through the skill directory, pruning unwanted subtrees
+            added = []
+            for root, dirs, files in os.walk(skill_path):
+                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in _SKIPPED_DIRS]
+                for name in files:
                     # Skip common unwanted files
-                    if file_path.name.startswith('.') or file_path.name == '__pycache__':
-                        continue
-                    if file_path.suffix in ['.pyc', '.pyo']:
+                    if name.startswith('.') or name.endswith(('.pyc', '.pyo')):
                         continue
 
                     # Calculate the relative path within the zip
+                    file_path = Path(root) / name
                     arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
-                    file_count += 1
-
-        print(f"\nSuccessfully packaged {file_count} files to: {skill_filename}")
+                    if file_path.suffix.lower() in _INCOMPRESSIBLE:
+                        method = zipfile.ZIP_STORED
+                    else:
+                        method = compression
+                    zipf.write(file_path, arcname, compress_type=method, compresslevel=6)
+                    added.append(f"  Added: {arcname}\n")
+
+        # Report added files in one write rather than one print per file
+        sys.stdout.write("".join(added))
+        print(f"\nSuccessfully packaged {len(added)} files to: {skill_filename}")
         print(f"File size: {skill_filename.stat().st_size / 1024:.1f} KB")
         return skill_filename
 
@@ -113,15 +137,30 @@ def main():
         print(__doc__)
         sys.exit(1)
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    args = sys.argv[1:]
+    compression = zipfile.ZIP_DEFLATED
+    if "--compression" in args:
+        i = args.index("--compression")
+        name = args[i + 1] if i + 1 < len(args) else ""
+        if name not in COMPRESSION_METHODS:
+            print(f"Invalid value for --compression. Use one of: {', '.join(COMPRESSION_METHODS)}")
+            sys.exit(1)
+        compression = COMPRESSION_METHODS[name]
+        del args[i:i + 2]
+
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+
+    skill_path = args[0]
+    output_dir = args[1] if len(args) > 1 else None
 
     print(f"Packaging skill: {skill_path}")
     if output_dir:
         print(f"Output directory: {output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(skill_path, output_dir, compression)
 
     if result:
         sys.exit(0)
@@ -11,32 +11,45 @@ Validates generated skills against Anthropic skills conventions:
 - Content structure verification
 
 Usage:
-    python validate_skill.py <path_to_SKILL.md>
-    python validate_skill.py <path_to_skill_directory>
+    python validate_skill.py <path_to_SKILL.md> [--fast-fail]
+    python validate_skill.py <path_to_skill_directory> [--fast-fail]
+    python validate_skill.py --batch [--fast-fail] < paths.txt
+
+--fast-fail stops at the first error; use it when only the exit code matters.
+--batch validates newline-separated paths from stdin (NDJSON output).
 """
 
+import functools
 import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
 try:
     import yaml
 except ImportError:
     yaml = None
 
+# Prefer the libyaml-backed loader; it is much faster than pure-Python SafeLoader
+_HAS_CSAFE = yaml is not None and hasattr(yaml, "CSafeLoader")
+YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+if yaml is not None and not _HAS_CSAFE:
+    # Environment notice, printed once per process and kept out of the JSON results
+    print("warning: PyYAML was built without libyaml; YAML parsing will be slower. "
+          "Reinstall PyYAML with libyaml for the C loader.", file=sys.stderr)
+
 
-@dataclass
-class ValidationIssue:
+class ValidationIssue(NamedTuple):
     """A single validation issue."""
     level: str  # "error" or "warning"
     field: str
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of skill validation."""
     valid: bool
@@ -50,11 +63,19 @@ class ValidationResult:
 # Anthropic skills constraints
 NAME_MAX_LENGTH = 64
 DESCRIPTION_MAX_LENGTH = 1024
-RESERVED_WORDS = ["anthropic", "claude"]
+RESERVED_WORDS = ("anthropic", "claude")
 NAME_PATTERN = re.compile(r'^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$')
+_NAME_CHARS_RE = re.compile(r'^[a-z0-9-]+$')
+_KV_RE = re.compile(r'^([a-zA-Z_][a-zA-Z0-9_]*)\s*:\s*(.*)$')
+_FILE_REF_RE = re.compile(r'`([^`]+\.(?:md|py|sh|json))`')
+# Phrases suggesting the description explains when to use the skill
+_TRIGGER_INDICATORS = ("when", "use this", "should be used", "helps with", "for")
+# Markers of examples or task/workflow guidance in the body, matched in one pass
+_EXAMPLE_RE = re.compile(r'## example|### example|example:|examples|core tasks|workflow', re.IGNORECASE)
 
 # Allowed frontmatter properties (per Anthropic's skill-creator)
 ALLOWED_FRONTMATTER_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
+_ALLOWED_FM_SORTED_STR = ", ".join(sorted(ALLOWED_FRONTMATTER_PROPERTIES))
 
 
 def _normalize_yaml_value(value: str) -> str:
@@ -70,17 +91,25 @@ def _parse_simple_frontmatter(frontmatter_lines: list[str]) -> dict:
     frontmatter = {}
     current_key = None
     current_value_lines = []
+    # Bound once outside the per-line loop
+    match_key = _KV_RE.match
+    indents = ("  ", "\t")
 
     for line in frontmatter_lines:
-        key_match = re.match(r'^([a-zA-Z_][a-zA-Z0-9_]*)\s*:\s*(.*)$', line)
+        if line.startswith(indents):
+            if current_key:
+                current_value_lines.append(line.strip())
+            continue
+        # Keys start with a letter or underscore; skip the regex otherwise
+        if not line or not (line[0].isalpha() or line[0] == "_"):
+            continue
+        key_match = match_key(line)
         if key_match:
             if current_key:
                 value = "\n".join(current_value_lines)
                 frontmatter[current_key] = _normalize_yaml_value(value)
             current_key = key_match.group(1)
             current_value_lines = [key_match.group(2)]
-        elif current_key and (line.startswith("  ") or line.startswith("\t")):
-            current_value_lines.append(line.strip())
 
     if current_key:
         value = "\n".join(current_value_lines)
@@ -102,56 +131,91 @@ def extract_frontmatter(content: str) -> tuple[Optional[dict], Optional[str], Op
     if not content.strip().startswith("---"):
         return None, content, "Missing YAML frontmatter (file must start with ---)"
 
-    # Find the closing ---
-    lines = content.split("\n")
+    # Find the closing --- line, scanning the original string in place
+    frontmatter_start = content.find("\n") + 1
     frontmatter_end = -1
-
-    for i, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            frontmatter_end = i
-            break
+    body_start = len(content)
+    if frontmatter_start:
+        pos = content.find("\n---", frontmatter_start - 1)
+        while pos != -1:
+            line_end = content.find("\n", pos + 4)
+            if line_end == -1:
+                line_end = len(content)
+            if not content[pos + 4:line_end].strip():
+                frontmatter_end = pos
+                body_start = line_end + 1
+                break
+            pos = content.find("\n---", line_end)
 
     if frontmatter_end == -1:
         return None, content, "Invalid YAML frontmatter (missing closing ---)"
 
-    frontmatter_lines = lines[1:frontmatter_end]
-    frontmatter_text = "\n".join(frontmatter_lines)
+    frontmatter_text = content[frontmatter_start:frontmatter_end]
 
     if yaml:
         try:
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = yaml.load(frontmatter_text, Loader=YAML_LOADER)
         except yaml.YAMLError as e:
+            # libyaml's messages omit the offending character and source snippet,
+            # so re-parse with the pure-Python loader to report its error instead
+            if YAML_LOADER is not yaml.SafeLoader:
+                try:
+                    yaml.load(frontmatter_text, Loader=yaml.SafeLoader)
+                except yaml.YAMLError as detailed:
+                    e = detailed
             return None, content, f"Invalid YAML in frontmatter: {e}"
         if frontmatter is None:
             frontmatter = {}
         if not isinstance(frontmatter, dict):
             return None, content, "Frontmatter must be a YAML mapping"
     else:
-        frontmatter = _parse_simple_frontmatter(frontmatter_lines)
+        frontmatter = _parse_simple_frontmatter(frontmatter_text.split("\n"))
 
-    body = "\n".join(lines[frontmatter_end + 1:])
+    body = content[body_start:]
 
     return frontmatter, body, None
 
 
+def _read_frontmatter_block(f) -> str:
+    """
+    Read lines from an open file up to and including the closing --- fence.
+
+    Stops early at the first non-blank line if the file does not open with
+    ---, so a file without frontmatter is not read past its first line.
+    The rest of the file is left unread for the caller.
+    """
+    lines = []
+    opened = False
+    for line in f:
+        lines.append(line)
+        if opened:
+            if line.startswith("---") and not line[3:].strip():
+                break
+        elif line.strip():
+            if not line.lstrip().startswith("---"):
+                break
+            opened = True
+    return "".join(lines)
+
+
 def validate_frontmatter_properties(frontmatter: dict) -> list[ValidationIssue]:
     """Validate that frontmatter only contains allowed properties."""
     issues = []
 
-    unexpected_keys = set(frontmatter.keys()) - ALLOWED_FRONTMATTER_PROPERTIES
+    unexpected_keys = frontmatter.keys() - ALLOWED_FRONTMATTER_PROPERTIES
     if unexpected_keys:
         issues.append(ValidationIssue(
             "error",
             "frontmatter",
             f"Unexpected frontmatter properties: {', '.join(sorted(unexpected_keys))}. "
-            f"Allowed: {', '.join(sorted(ALLOWED_FRONTMATTER_PROPERTIES))}"
+            f"Allowed: {_ALLOWED_FM_SORTED_STR}"
         ))
 
     return issues
 
 
-def validate_name(name: Optional[str]) -> list[ValidationIssue]:
-    """Validate the skill name field."""
+def validate_name(name: Optional[str], fast_fail: bool = False) -> list[ValidationIssue]:
+    """Validate the skill name field (stopping at the first error if fast_fail)."""
     issues = []
 
     if not name:
@@ -162,25 +226,34 @@ def validate_name(name: Optional[str]) -> list[ValidationIssue]:
         issues.append(ValidationIssue("error", "name", f"Field 'name' must be a string, got {type(name).__name__}"))
         return issues
 
+    name_lower = name.lower()
+
     # Length check
     if len(name) > NAME_MAX_LENGTH:
         issues.append(ValidationIssue("error", "name", f"Field 'name' exceeds {NAME_MAX_LENGTH} characters (got {len(name)})"))
+        if fast_fail:
+            return issues
 
     # Format check
     if not NAME_PATTERN.match(name):
-        if name != name.lower():
+        if name != name_lower:
             issues.append(ValidationIssue("error", "name", "Field 'name' must be lowercase"))
         elif " " in name:
             issues.append(ValidationIssue("error", "name", "Field 'name' cannot contain spaces (use hyphens)"))
         elif "_" in name:
             issues.append(ValidationIssue("warning", "name", "Field 'name' uses underscores (prefer hyphens for consistency)"))
-        elif not re.match(r'^[a-z0-9-]+$', name):
+        elif not _NAME_CHARS_RE.match(name):
             issues.append(ValidationIssue("error", "name", "Field 'name' must contain only lowercase letters, numbers, and hyphens"))
+        if fast_fail and issues and issues[-1].level == "error":
+            return issues
 
     # Reserved words check
-    for reserved in RESERVED_WORDS:
-        if reserved in name.lower():
-            issues.append(ValidationIssue("error", "name", f"Field 'name' cannot contain reserved word '{reserved}'"))
+    if any(reserved in name_lower for reserved in RESERVED_WORDS):
+        for reserved in RESERVED_WORDS:
+            if reserved in name_lower:
+                issues.append(ValidationIssue("error", "name", f"Field 'name' cannot contain reserved word '{reserved}'"))
+                if fast_fail:
+                    return issues
 
     # XML tag check
     if "<" in name or ">" in name:
@@ -189,8 +262,8 @@ def validate_name(name: Optional[str]) -> list[ValidationIssue]:
     return issues
 
 
-def validate_description(description: Optional[str]) -> list[ValidationIssue]:
-    """Validate the skill description field."""
+def validate_description(description: Optional[str], fast_fail: bool = False) -> list[ValidationIssue]:
+    """Validate the skill description field (stopping at the first error if fast_fail)."""
     issues = []
 
     if not description:
@@ -207,20 +280,25 @@ def validate_description(description: Optional[str]) -> list[ValidationIssue]:
         return issues
 
     # Length check
-    if len(description) > DESCRIPTION_MAX_LENGTH:
-        issues.append(ValidationIssue("error", "description", f"Field 'description' exceeds {DESCRIPTION_MAX_LENGTH} characters (got {len(description)})"))
+    desc_len = len(description)
+    if desc_len > DESCRIPTION_MAX_LENGTH:
+        issues.append(ValidationIssue("error", "description", f"Field 'description' exceeds {DESCRIPTION_MAX_LENGTH} characters (got {desc_len})"))
+        if fast_fail:
+            return issues
 
     # XML tag check
     if "<" in description or ">" in description:
         issues.append(ValidationIssue("error", "description", "Field 'description' cannot contain XML tags"))
+        if fast_fail:
+            return issues
 
     # Quality checks (warnings)
-    if len(description) < 50:
+    if desc_len < 50:
         issues.append(ValidationIssue("warning", "description", "Field 'description' is quite short - consider adding more detail"))
 
     # Check for trigger phrases (best practice)
-    trigger_indicators = ["when", "use this", "should be used", "helps with", "for"]
-    has_trigger = any(indicator in description.lower() for indicator in trigger_indicators)
+    desc_lower = description.lower()
+    has_trigger = any(indicator in desc_lower for indicator in _TRIGGER_INDICATORS)
     if not has_trigger:
         issues.append(ValidationIssue("warning", "description", "Description lacks trigger phrases - consider explaining when to use this skill"))
 
@@ -243,16 +321,7 @@ def validate_body(body: str) -> list[ValidationIssue]:
         issues.append(ValidationIssue("warning", "body", f"Skill body is very long ({word_count} words) - consider moving details to references/"))
 
     # Check for examples or task/workflow guidance
-    body_lower = body.lower()
-    example_markers = [
-        "## example",
-        "### example",
-        "example:",
-        "examples",
-        "core tasks",
-        "workflow"
-    ]
-    if not any(marker in body_lower for marker in example_markers):
+    if not _EXAMPLE_RE.search(body):
         issues.append(ValidationIssue(
             "warning",
             "body",
@@ -262,16 +331,48 @@ def validate_body(body: str) -> list[ValidationIssue]:
     return issues
 
 
-def validate_skill_file(file_path: str) -> ValidationResult:
+@functools.lru_cache(maxsize=256)
+def _read_and_parse(file_path: str, mtime_ns: int, size: int) -> tuple[Optional[str], Optional[dict], Optional[str], Optional[str]]:
+    """
+    Read and parse a SKILL.md file, cached per (path, mtime, size).
+
+    The frontmatter is parsed before the body is read, so files with
+    invalid frontmatter are not read in full. Cached values are shared;
+    callers must not mutate them.
+
+    Returns:
+        Tuple of (full content or None if only the frontmatter block was
+        read, frontmatter_dict, body_content, error_message)
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        head = _read_frontmatter_block(f)
+        frontmatter, body, fm_error = extract_frontmatter(head)
+        if fm_error:
+            return None, None, None, fm_error
+        rest = f.read()
+    return head + rest, frontmatter, body + rest, None
+
+
+def _has_error(issues: list[ValidationIssue]) -> bool:
+    return any(issue.level == "error" for issue in issues)
+
+
+def validate_skill_file(file_path: str, fast_fail: bool = False) -> ValidationResult:
     """
     Validate a SKILL.md file.
 
     Args:
         file_path: Path to the SKILL.md file
+        fast_fail: Stop at the first error when only validity matters
 
     Returns:
-        ValidationResult with all findings
+        ValidationResult with all findings (only the first error if fast_fail)
     """
+    return _validate_skill_file(file_path, fast_fail)[0]
+
+
+def _validate_skill_file(file_path: str, fast_fail: bool = False) -> tuple[ValidationResult, Optional[str]]:
+    """Validate a SKILL.md file, also returning its content if it was read in full."""
     issues = []
     warnings = []
 
@@ -284,12 +385,12 @@ def validate_skill_file(file_path: str) -> ValidationResult:
             description=None,
             issues=[ValidationIssue("error", "file", f"File not found: {file_path}")],
             warnings=[]
-        )
+        ), None
 
-    # Read file
+    # Read and parse the file, reusing the cached parse if it is unchanged
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        st = os.stat(file_path)
+        content, frontmatter, body, fm_error = _read_and_parse(file_path, st.st_mtime_ns, st.st_size)
     except Exception as e:
         return ValidationResult(
             valid=False,
@@ -298,10 +399,8 @@ def validate_skill_file(file_path: str) -> ValidationResult:
             description=None,
             issues=[ValidationIssue("error", "file", f"Failed to read file: {e}")],
             warnings=[]
-        )
+        ), None
 
-    # Parse frontmatter
-    frontmatter, body, fm_error = extract_frontmatter(content)
     if fm_error:
         return ValidationResult(
             valid=False,
@@ -310,7 +409,7 @@ def validate_skill_file(file_path: str) -> ValidationResult:
             description=None,
             issues=[ValidationIssue("error", "frontmatter", fm_error)],
             warnings=[]
-        )
+        ), None
 
     if yaml is None:
         warnings.append(ValidationIssue(
@@ -320,50 +419,63 @@ def validate_skill_file(file_path: str) -> ValidationResult:
         ))
 
     # Validate frontmatter properties
-    fm_property_issues = validate_frontmatter_properties(frontmatter)
+    all_issues = validate_frontmatter_properties(frontmatter)
 
     # Validate name
     name = frontmatter.get("name")
-    name_issues = validate_name(name)
+    if not (fast_fail and _has_error(all_issues)):
+        all_issues += validate_name(name, fast_fail)
 
     # Validate description
     description = frontmatter.get("description")
-    desc_issues = validate_description(description)
+    if not (fast_fail and _has_error(all_issues)):
+        all_issues += validate_description(description, fast_fail)
 
     # Validate body
-    body_issues = validate_body(body or "")
+    if not (fast_fail and _has_error(all_issues)):
+        all_issues += validate_body(body or "")
 
     # Separate errors and warnings
-    all_issues = fm_property_issues + name_issues + desc_issues + body_issues
     for issue in all_issues:
         if issue.level == "error":
             issues.append(issue)
         else:
             warnings.append(issue)
 
+    # Only strings are truncated; non-string values were already reported above
+    desc_len = len(description) if isinstance(description, str) else 0
+
     return ValidationResult(
         valid=len(issues) == 0,
         skill_path=file_path,
         name=name,
-        description=description[:100] + "..." if description and len(description) > 100 else description,
+        description=f"{description[:100]}..." if desc_len > 100 else description,
         issues=issues,
         warnings=warnings
-    )
+    ), content
 
 
-def validate_skill_directory(dir_path: str) -> ValidationResult:
+def validate_skill_directory(dir_path: str, fast_fail: bool = False) -> ValidationResult:
     """
     Validate a skill directory.
 
     Args:
         dir_path: Path to the skill directory
+        fast_fail: Stop at the first error when only validity matters
 
     Returns:
         ValidationResult with all findings
     """
     skill_md_path = os.path.join(dir_path, "SKILL.md")
 
-    if not os.path.exists(skill_md_path):
+    # One directory read answers all top-level existence checks
+    try:
+        with os.scandir(dir_path) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        entries = {}
+
+    if "SKILL.md" not in entries:
         return ValidationResult(
             valid=False,
             skill_path=dir_path,
@@ -373,26 +485,32 @@ def validate_skill_directory(dir_path: str) -> ValidationResult:
             warnings=[]
         )
 
-    result = validate_skill_file(skill_md_path)
+    result, content = _validate_skill_file(skill_md_path, fast_fail)
+    if fast_fail and not result.valid:
+        return result
 
     # Additional directory checks
     additional_warnings = []
 
     # Check for common directories
-    has_references = os.path.isdir(os.path.join(dir_path, "references"))
-    has_examples = os.path.isdir(os.path.join(dir_path, "examples"))
-    has_scripts = os.path.isdir(os.path.join(dir_path, "scripts"))
+    has_references = "references" in entries and entries["references"].is_dir()
+    has_examples = "examples" in entries and entries["examples"].is_dir()
+    has_scripts = "scripts" in entries and entries["scripts"].is_dir()
 
     # Check if SKILL.md references files that don't exist
     try:
-        with open(skill_md_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        if content is None:
+            with open(skill_md_path, "r", encoding="utf-8") as f:
+                content = f.read()
 
         # Look for references to files
-        file_refs = re.findall(r'`([^`]+\.(md|py|sh|json))`', content)
-        for ref, _ in file_refs:
-            ref_path = os.path.join(dir_path, ref)
-            if not os.path.exists(ref_path):
+        file_refs = _FILE_REF_RE.findall(content)
+        for ref in file_refs:
+            if "/" in ref or os.sep in ref:
+                ref_exists = os.path.exists(os.path.join(dir_path, ref))
+            else:
+                ref_exists = ref in entries
+            if not ref_exists:
                 additional_warnings.append(
                     ValidationIssue("warning", "references", f"Referenced file not found: {ref}")
                 )
@@ -403,7 +521,30 @@ def validate_skill_directory(dir_path: str) -> ValidationResult:
     return result
 
 
-def result_to_json(result: ValidationResult) -> str:
+def validate_many(paths: list[str], max_workers: int = 8, fast_fail: bool = False) -> list[ValidationResult]:
+    """
+    Validate several skill directories or SKILL.md files concurrently.
+
+    Args:
+        paths: Skill directory or SKILL.md paths
+        max_workers: Maximum number of concurrent validations
+        fast_fail: Stop each validation at its first error
+
+    Returns:
+        List of ValidationResult in the same order as paths
+    """
+    def validate(path: str) -> ValidationResult:
+        if os.path.isdir(path):
+            return validate_skill_directory(path, fast_fail)
+        return validate_skill_file(path, fast_fail)
+
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+        return list(executor.map(validate, paths))
+
+
+def result_to_json(result: ValidationResult, indent: Optional[int] = 2) -> str:
     """Convert ValidationResult to JSON string."""
     return json.dumps({
         "valid": result.valid,
@@ -418,7 +559,7 @@ def result_to_json(result: ValidationResult) -> str:
             {"field": i.field, "message": i.message}
             for i in result.warnings
         ]
-    }, indent=2)
+    }, indent=indent)
 
 
 def main():
@@ -427,12 +568,21 @@ def main():
         print(__doc__)
         sys.exit(1)
 
+    fast_fail = "--fast-fail" in sys.argv[2:]
+
+    if sys.argv[1] == "--batch":
+        paths = [line.strip() for line in sys.stdin if line.strip()]
+        results = validate_many(paths, fast_fail=fast_fail)
+        for result in results:
+            print(result_to_json(result, indent=None))
+        sys.exit(0 if all(r.valid for r in results) else 1)
+
     path = sys.argv[1]
 
     if os.path.isfile(path):
-        result = validate_skill_file(path)
+        result = validate_skill_file(path, fast_fail)
     elif os.path.isdir(path):
-        result = validate_skill_directory(path)
+        result = validate_skill_directory(path, fast_fail)
     else:
         print(json.dumps({
             "valid": False,